@@ -0,0 +1,25 @@
+"""Use MCP tools from sync code.
+
+Entering `MCPTools` as a regular (sync) context manager keeps the MCP session open on a background
+event loop, so the tools can be used with `agent.print_response` and `agent.run`.
+
+Run: `pip install agno mcp openai` to install the dependencies
+"""
+
+from pathlib import Path
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tools.mcp import MCPTools
+
+file_path = str(Path(__file__).parents[3] / "libs/agno")
+
+with MCPTools(f"npx -y @modelcontextprotocol/server-filesystem {file_path}") as mcp_tools:
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        tools=[mcp_tools],
+        instructions="Use the list_allowed_directories tool to find directories that you can access",
+        show_tool_calls=True,
+        markdown=True,
+    )
+    agent.print_response("What is the license for this project?", stream=True)
@@ -180,6 +180,8 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls run concurrently in async runs. Set to 0 to run all tool calls of a turn at once.
+    max_parallel_tools: int = 8
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -377,6 +379,7 @@ class Agent:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tools: Optional[int] = 8,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         reasoning: bool = False,
@@ -474,6 +477,8 @@ class Agent:
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        # None is stored as 0, as deep_copy() skips fields set to None
+        self.max_parallel_tools = max_parallel_tools if max_parallel_tools is not None else 0
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -1216,6 +1221,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tools=self.max_parallel_tools or None,
             response_format=response_format,
         )
 
@@ -2249,6 +2255,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tools=self.max_parallel_tools or None,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -3092,6 +3099,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tools=self.max_parallel_tools or None,
             stream_model_response=stream_model_response,
         )  # type: ignore
 
@@ -1,11 +1,12 @@
 """Logic used by the AG-UI router."""
 
+import asyncio
 import json
 import uuid
 from collections import deque
 from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import AsyncIterator, Deque, List, Optional, Set, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 from ag_ui.core import (
     BaseEvent,
@@ -28,36 +29,72 @@ from agno.run.response import RunEvent, RunResponseContentEvent, RunResponseEven
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunEvent, TeamRunResponseEvent
 
+# Text deltas streamed within this window are emitted as a single TEXT_MESSAGE_CONTENT event
+TEXT_FLUSH_INTERVAL_SECONDS = 0.05
+
+# Run events ending the AG-UI stream. Chunks store their event as a string, which matches the str enum members.
+_RUN_END_EVENTS = frozenset({RunEvent.run_completed, TeamRunEvent.run_completed, RunEvent.run_paused})
+
+# Number of response chunks read ahead of the AG-UI stream, all processed together once available
+MAX_CHUNK_BATCH_SIZE = 64
+
+# Marks the end of the response stream in the chunk queue
+_STREAM_END = object()
+
+# States of the tool calls tracked by the EventBuffer
+_TOOL_CALL_ACTIVE = 1
+_TOOL_CALL_ENDED = 2
+
 
 @dataclass
 class EventBuffer:
     """Buffer to manage event ordering constraints, relevant when mapping Agno responses to AG-UI events."""
 
+    __slots__ = ("buffer", "blocking_tool_call_id", "_tool_state", "_buffered_args")
+
     buffer: Deque[BaseEvent]
     blocking_tool_call_id: Optional[str]  # The tool call that's currently blocking the buffer
-    active_tool_call_ids: Set[str]  # All currently active tool calls
-    ended_tool_call_ids: Set[str]  # All tool calls that have ended
+    _tool_state: Dict[str, int]  # The state of each tool call, active or ended
+    _buffered_args: Dict[str, Tuple[BaseEvent, List[str]]]  # Buffered args event and deltas of each tool call
 
     def __init__(self):
         self.buffer = deque()
         self.blocking_tool_call_id = None
-        self.active_tool_call_ids = set()
-        self.ended_tool_call_ids = set()
+        self._tool_state = {}
+        self._buffered_args = {}
+
+    @property
+    def active_tool_call_ids(self) -> Set[str]:
+        """All currently active tool calls."""
+        return {tool_call_id for tool_call_id, state in self._tool_state.items() if state == _TOOL_CALL_ACTIVE}
+
+    @property
+    def ended_tool_call_ids(self) -> Set[str]:
+        """All tool calls that have ended."""
+        return {tool_call_id for tool_call_id, state in self._tool_state.items() if state == _TOOL_CALL_ENDED}
 
     def is_blocked(self) -> bool:
         """Check if the buffer is currently blocked by an active tool call."""
         return self.blocking_tool_call_id is not None
 
+    def is_active(self, tool_call_id: Optional[str]) -> bool:
+        """Check if a tool call has started and not ended yet."""
+        return tool_call_id is not None and self._tool_state.get(tool_call_id) == _TOOL_CALL_ACTIVE
+
+    def has_ended(self, tool_call_id: Optional[str]) -> bool:
+        """Check if a tool call has ended."""
+        return tool_call_id is not None and self._tool_state.get(tool_call_id) == _TOOL_CALL_ENDED
+
     def start_tool_call(self, tool_call_id: str) -> None:
         """Start a new tool call, marking it the current blocking tool call if needed."""
-        self.active_tool_call_ids.add(tool_call_id)
+        # A tool call that has already ended stays ended
+        self._tool_state.setdefault(tool_call_id, _TOOL_CALL_ACTIVE)
         if self.blocking_tool_call_id is None:
             self.blocking_tool_call_id = tool_call_id
 
     def end_tool_call(self, tool_call_id: str) -> bool:
         """End a tool call, marking it as ended and unblocking the buffer if needed."""
-        self.active_tool_call_ids.discard(tool_call_id)
-        self.ended_tool_call_ids.add(tool_call_id)
+        self._tool_state[tool_call_id] = _TOOL_CALL_ENDED
 
         # Unblock the buffer if the current blocking tool call is the one ending
         if tool_call_id == self.blocking_tool_call_id:
@@ -66,6 +103,33 @@ class EventBuffer:
 
         return False
 
+    def buffer_event(self, event: BaseEvent) -> None:
+        """Buffer an event, merging the args deltas of a tool call into its buffered args event."""
+        tool_call_id = getattr(event, "tool_call_id", None)
+        if event.type is EventType.TOOL_CALL_ARGS:
+            buffered_args = self._buffered_args.get(tool_call_id)  # type: ignore
+            if buffered_args is not None:
+                buffered_args[1].append(event.delta)  # type: ignore
+                return
+            self._buffered_args[tool_call_id] = (event, [event.delta])  # type: ignore
+        elif tool_call_id is not None:
+            # Args buffered after another event of their tool call can't be merged into the args before it
+            self._close_buffered_args(tool_call_id)
+        self.buffer.append(event)
+
+    def _close_buffered_args(self, tool_call_id: str) -> None:
+        buffered_args = self._buffered_args.pop(tool_call_id, None)
+        if buffered_args is not None and len(buffered_args[1]) > 1:
+            buffered_args[0].delta = "".join(buffered_args[1])  # type: ignore
+
+    def drain(self) -> Deque[BaseEvent]:
+        """Remove and return all buffered events, in the order they were buffered."""
+        for tool_call_id in list(self._buffered_args):
+            self._close_buffered_args(tool_call_id)
+        events = self.buffer
+        self.buffer = deque()
+        return events
+
 
 def convert_agui_messages_to_agno_messages(messages: List[AGUIMessage]) -> List[Message]:
     """Convert AG-UI messages to Agno messages."""
@@ -183,7 +247,7 @@ def _create_events_from_chunk(
     elif chunk.event == RunEvent.tool_call_completed:
         if chunk.tool is not None:  # type: ignore
             tool_call = chunk.tool  # type: ignore
-            if tool_call.tool_call_id not in event_buffer.ended_tool_call_ids:
+            if not event_buffer.has_ended(tool_call.tool_call_id):
                 end_event = ToolCallEndEvent(
                     type=EventType.TOOL_CALL_END,
                     tool_call_id=tool_call.tool_call_id,  # type: ignore
@@ -223,13 +287,12 @@ def _create_completion_events(
     events_to_emit = []
 
     # End remaining active tool calls if needed
-    for tool_call_id in list(event_buffer.active_tool_call_ids):
-        if tool_call_id not in event_buffer.ended_tool_call_ids:
-            end_event = ToolCallEndEvent(
-                type=EventType.TOOL_CALL_END,
-                tool_call_id=tool_call_id,
-            )
-            events_to_emit.append(end_event)
+    for tool_call_id in event_buffer.active_tool_call_ids:
+        end_event = ToolCallEndEvent(
+            type=EventType.TOOL_CALL_END,
+            tool_call_id=tool_call_id,
+        )
+        events_to_emit.append(end_event)
 
     # End the message and run, denoting the end of the session
     if message_started:
@@ -269,52 +332,93 @@ def _create_completion_events(
     return events_to_emit
 
 
+def _emit_tool_call_start(event: BaseEvent, event_buffer: EventBuffer) -> List[BaseEvent]:
+    """Emit a tool call start event, buffering it while another tool call is blocking."""
+    if event_buffer.is_blocked():
+        event_buffer.buffer_event(event)
+        return []
+
+    tool_call_id = getattr(event, "tool_call_id", None)
+    if tool_call_id:
+        event_buffer.start_tool_call(tool_call_id)
+    return [event]
+
+
+def _emit_tool_call_args(event: BaseEvent, event_buffer: EventBuffer) -> List[BaseEvent]:
+    """Emit a tool call args event, buffering it while blocked unless its tool call is active."""
+    if event_buffer.is_blocked() and not event_buffer.is_active(getattr(event, "tool_call_id", None)):
+        event_buffer.buffer_event(event)
+        return []
+
+    return [event]
+
+
+def _emit_tool_call_end(event: BaseEvent, event_buffer: EventBuffer) -> List[BaseEvent]:
+    """Emit a tool call end event, flushing the buffered events if it ends the blocking tool call."""
+    tool_call_id = getattr(event, "tool_call_id", None)
+
+    if not event_buffer.is_blocked():
+        if tool_call_id:
+            event_buffer.end_tool_call(tool_call_id)
+        return [event]
+
+    if tool_call_id and tool_call_id == event_buffer.blocking_tool_call_id:
+        events_to_emit = [event]
+        event_buffer.end_tool_call(tool_call_id)
+        # Flush buffered events after ending the blocking tool call. Each event is processed once, so events that
+        # are blocked again by a buffered tool call stay buffered, in order, until that tool call ends.
+        for buffered_event in event_buffer.drain():
+            # Recursively process buffered events
+            nested_events = _emit_event_logic(buffered_event, event_buffer)
+            events_to_emit.extend(nested_events)
+        return events_to_emit
+
+    event_buffer.buffer_event(event)
+    if tool_call_id and event_buffer.is_active(tool_call_id):
+        event_buffer.end_tool_call(tool_call_id)
+    return []
+
+
+def _emit_other_event(event: BaseEvent, event_buffer: EventBuffer) -> List[BaseEvent]:
+    """Emit any other event, buffering it while a tool call is blocking."""
+    if event_buffer.is_blocked():
+        event_buffer.buffer_event(event)
+        return []
+
+    return [event]
+
+
+# Handlers for the event types with ordering constraints, any other event is handled by _emit_other_event
+_EVENT_HANDLERS: Dict[EventType, Callable[[BaseEvent, EventBuffer], List[BaseEvent]]] = {
+    EventType.TOOL_CALL_START: _emit_tool_call_start,
+    EventType.TOOL_CALL_ARGS: _emit_tool_call_args,
+    EventType.TOOL_CALL_END: _emit_tool_call_end,
+}
+
+
 def _emit_event_logic(event: BaseEvent, event_buffer: EventBuffer) -> List[BaseEvent]:
     """Process an event through the buffer and return events to actually emit."""
+    return _EVENT_HANDLERS.get(event.type, _emit_other_event)(event, event_buffer)
+
+
+def _emit_completion_events(
+    chunk: Union[RunResponseEvent, TeamRunResponseEvent],
+    event_buffer: EventBuffer,
+    message_started: bool,
+    message_id: str,
+    thread_id: str,
+    run_id: str,
+) -> List[BaseEvent]:
+    """Process the run completion events through the buffer, flushing every buffered event before the run ends."""
     events_to_emit = []
+    for event in _create_completion_events(chunk, event_buffer, message_started, message_id, thread_id, run_id):
+        events_to_emit.extend(_emit_event_logic(event, event_buffer))
 
-    if event_buffer.is_blocked():
-        # Handle events related to the current blocking tool call
-        if event.type == EventType.TOOL_CALL_ARGS:
-            if hasattr(event, "tool_call_id") and event.tool_call_id in event_buffer.active_tool_call_ids:  # type: ignore
-                events_to_emit.append(event)
-            else:
-                event_buffer.buffer.append(event)
-        elif event.type == EventType.TOOL_CALL_END:
-            tool_call_id = getattr(event, "tool_call_id", None)
-            if tool_call_id and tool_call_id == event_buffer.blocking_tool_call_id:
-                events_to_emit.append(event)
-                event_buffer.end_tool_call(tool_call_id)
-                # Flush buffered events after ending the blocking tool call
-                while event_buffer.buffer:
-                    buffered_event = event_buffer.buffer.popleft()
-                    # Recursively process buffered events
-                    nested_events = _emit_event_logic(buffered_event, event_buffer)
-                    events_to_emit.extend(nested_events)
-            elif tool_call_id and tool_call_id in event_buffer.active_tool_call_ids:
-                event_buffer.buffer.append(event)
-                event_buffer.end_tool_call(tool_call_id)
-            else:
-                event_buffer.buffer.append(event)
-        # Handle all other events
-        elif event.type == EventType.TOOL_CALL_START:
-            event_buffer.buffer.append(event)
-        else:
-            event_buffer.buffer.append(event)
-    # If the buffer is not blocked, emit the events normally
-    else:
-        if event.type == EventType.TOOL_CALL_START:
-            tool_call_id = getattr(event, "tool_call_id", None)
-            if tool_call_id:
-                event_buffer.start_tool_call(tool_call_id)
-            events_to_emit.append(event)
-        elif event.type == EventType.TOOL_CALL_END:
-            tool_call_id = getattr(event, "tool_call_id", None)
-            if tool_call_id:
-                event_buffer.end_tool_call(tool_call_id)
-            events_to_emit.append(event)
-        else:
-            events_to_emit.append(event)
+    # Tool calls started while flushing the buffer can still block it, with the completion events buffered behind
+    # them. End them so the buffered events, up to the run finished event, are emitted.
+    while event_buffer.is_blocked():
+        end_event = ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=event_buffer.blocking_tool_call_id)  # type: ignore
+        events_to_emit.extend(_emit_event_logic(end_event, event_buffer))
 
     return events_to_emit
 
@@ -329,18 +433,12 @@ def stream_agno_response_as_agui_events(
 
     for chunk in response_stream:
         # Handle the lifecycle end event
-        if (
-            chunk.event == RunEvent.run_completed
-            or chunk.event == TeamRunEvent.run_completed
-            or chunk.event == RunEvent.run_paused
-        ):
-            completion_events = _create_completion_events(
+        if chunk.event in _RUN_END_EVENTS:
+            completion_events = _emit_completion_events(
                 chunk, event_buffer, message_started, message_id, thread_id, run_id
             )
-            for event in completion_events:
-                events_to_emit = _emit_event_logic(event_buffer=event_buffer, event=event)
-                for emit_event in events_to_emit:
-                    yield emit_event
+            for emit_event in completion_events:
+                yield emit_event
         else:
             # Process regular chunk
             events_from_chunk, message_started = _create_events_from_chunk(
@@ -353,38 +451,120 @@ def stream_agno_response_as_agui_events(
                     yield emit_event
 
 
-# Async version - thin wrapper
+async def _pump_response_stream(
+    response_stream: AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]],
+    chunk_queue: asyncio.Queue,
+    stream_closed: asyncio.Event,
+) -> None:
+    """Move the chunks of the response stream into the queue, followed by the end marker or the raised error."""
+    try:
+        async for chunk in response_stream:
+            await chunk_queue.put(chunk)
+    except BaseException as e:
+        # Nobody reads the queue anymore once the consumer has closed the stream and cancelled this task
+        if stream_closed.is_set():
+            raise
+        # Forward any other error, including a CancelledError raised by the stream, so the consumer doesn't wait
+        # for the next chunk forever
+        await chunk_queue.put(e)
+    else:
+        await chunk_queue.put(_STREAM_END)
+
+
 async def async_stream_agno_response_as_agui_events(
     response_stream: AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]],
     thread_id: str,
     run_id: str,
+    flush_interval: float = TEXT_FLUSH_INTERVAL_SECONDS,
 ) -> AsyncIterator[BaseEvent]:
-    """Map the Agno response stream to AG-UI format, handling event ordering constraints."""
+    """
+    Map the Agno response stream to AG-UI format, handling event ordering constraints.
+
+    Adjacent text deltas are coalesced into a single TEXT_MESSAGE_CONTENT event. The coalesced text is emitted once
+    flush_interval seconds have passed since its first delta, or as soon as any other event is emitted.
+    """
     message_id = str(uuid.uuid4())
     message_started = False
     event_buffer = EventBuffer()
+    loop = asyncio.get_running_loop()
+
+    pending_deltas: List[str] = []
+    flush_deadline = 0.0
+
+    def flush_text() -> TextMessageContentEvent:
+        content_event = TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id=message_id,
+            delta="".join(pending_deltas),
+        )
+        pending_deltas.clear()
+        return content_event
+
+    # The response stream is consumed by a single task, so waiting for its next chunk can time out without
+    # interrupting the stream
+    chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_CHUNK_BATCH_SIZE)
+    stream_closed = asyncio.Event()
+    pump_task = asyncio.ensure_future(_pump_response_stream(response_stream, chunk_queue, stream_closed))
+
+    try:
+        stream_ended = False
+        while not stream_ended:
+            first_chunk: Any
+            if pending_deltas:
+                try:
+                    first_chunk = await asyncio.wait_for(chunk_queue.get(), max(flush_deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    # No chunk arrived before the flush deadline
+                    yield flush_text()
+                    continue
+            else:
+                first_chunk = await chunk_queue.get()
+
+            # Process the chunks already queued in the same pass, without waiting on the queue for each of them
+            chunks = [first_chunk]
+            for _ in range(chunk_queue.qsize()):
+                chunks.append(chunk_queue.get_nowait())
+
+            for chunk in chunks:
+                if chunk is _STREAM_END:
+                    stream_ended = True
+                    break
+                if isinstance(chunk, BaseException):
+                    # Emit the text streamed before the error
+                    if pending_deltas:
+                        yield flush_text()
+                    raise chunk
+
+                # Handle the lifecycle end event
+                if chunk.event in _RUN_END_EVENTS:
+                    events_to_emit = _emit_completion_events(
+                        chunk, event_buffer, message_started, message_id, thread_id, run_id
+                    )
+                else:
+                    # Process regular chunk
+                    events, message_started = _create_events_from_chunk(
+                        chunk, message_id, message_started, event_buffer
+                    )
+                    events_to_emit = []
+                    for event in events:
+                        events_to_emit.extend(_emit_event_logic(event_buffer=event_buffer, event=event))
 
-    async for chunk in response_stream:
-        # Handle the lifecycle end event
-        if (
-            chunk.event == RunEvent.run_completed
-            or chunk.event == TeamRunEvent.run_completed
-            or chunk.event == RunEvent.run_paused
-        ):
-            completion_events = _create_completion_events(
-                chunk, event_buffer, message_started, message_id, thread_id, run_id
-            )
-            for event in completion_events:
-                events_to_emit = _emit_event_logic(event_buffer=event_buffer, event=event)
                 for emit_event in events_to_emit:
+                    if emit_event.type is EventType.TEXT_MESSAGE_CONTENT:
+                        if not pending_deltas:
+                            flush_deadline = loop.time() + flush_interval
+                        pending_deltas.append(emit_event.delta)  # type: ignore
+                        continue
+                    # Flush the coalesced text before any other event, keeping the event order
+                    if pending_deltas:
+                        yield flush_text()
                     yield emit_event
-        else:
-            # Process regular chunk
-            events_from_chunk, message_started = _create_events_from_chunk(
-                chunk, message_id, message_started, event_buffer
-            )
 
-            for event in events_from_chunk:
-                events_to_emit = _emit_event_logic(event_buffer=event_buffer, event=event)
-                for emit_event in events_to_emit:
-                    yield emit_event
+            if pending_deltas and loop.time() >= flush_deadline:
+                yield flush_text()
+
+        if pending_deltas:
+            yield flush_text()
+    finally:
+        stream_closed.set()
+        pump_task.cancel()
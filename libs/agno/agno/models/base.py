@@ -1,5 +1,6 @@
 import asyncio
 import collections.abc
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
@@ -431,6 +432,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tools: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate an asynchronous response from the model.
@@ -478,6 +480,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tools=max_parallel_tools,
                 ):
                     if isinstance(function_call_response, ModelResponse):
                         if (
@@ -889,6 +892,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tools: Optional[int] = None,
         stream_model_response: bool = True,
     ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         """
@@ -961,6 +965,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tools=max_parallel_tools,
                 ):
                     yield function_call_response
 
@@ -1400,6 +1405,33 @@ class Model(ABC):
         function_call_timer.stop()
         return success, function_call_timer, function_call
 
+    async def _arun_function_calls_concurrently(
+        self, function_calls: List[FunctionCall], max_parallel_tools: Optional[int] = None
+    ) -> List[Union[Tuple[Union[bool, AgentRunException], Timer, FunctionCall], BaseException]]:
+        """
+        Run the function calls concurrently and return their results in the order of the function calls.
+        If max_parallel_tools is set, at most that many function calls run at the same time.
+        """
+        semaphore = asyncio.Semaphore(max_parallel_tools) if max_parallel_tools is not None else None
+
+        async def run_function_call(fc: FunctionCall) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+            if semaphore is None:
+                return await self.arun_function_call(fc)
+            async with semaphore:
+                return await self.arun_function_call(fc)
+
+        if sys.version_info >= (3, 11):
+            # A TaskGroup cancels the remaining function calls as soon as one of them fails
+            tasks = []
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [task_group.create_task(run_function_call(fc)) for fc in function_calls]
+            except BaseExceptionGroup as e:  # noqa: F821
+                raise e.exceptions[0]
+            return [task.result() for task in tasks]
+
+        return await asyncio.gather(*(run_function_call(fc) for fc in function_calls), return_exceptions=True)
+
     async def arun_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1408,6 +1440,7 @@ class Model(ABC):
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
         skip_pause_check: bool = False,
+        max_parallel_tools: Optional[int] = None,
     ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
@@ -1532,9 +1565,7 @@ class Model(ABC):
                 )
             ]
 
-        results = await asyncio.gather(
-            *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
-        )
+        results = await self._arun_function_calls_concurrently(function_calls_to_run, max_parallel_tools)
 
         # Process results
         for result in results:
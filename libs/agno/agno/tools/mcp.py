@@ -1,3 +1,5 @@
+import asyncio
+import concurrent.futures
 from contextlib import AsyncExitStack
 from dataclasses import asdict, dataclass
 from datetime import timedelta
@@ -7,7 +9,13 @@ from typing import Any, Dict, List, Literal, Optional, Union
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_info, log_warning, logger
-from agno.utils.mcp import get_entrypoint_for_tool
+from agno.utils.loop_runner import get_blocking_portal
+from agno.utils.mcp import (
+    get_entrypoint_for_tool,
+    get_sync_entrypoint_for_tool,
+    get_tools_cache_message_handler,
+    list_tools,
+)
 
 try:
     from mcp import ClientSession, StdioServerParameters
@@ -44,10 +52,11 @@ class MCPTools(Toolkit):
     A toolkit for integrating Model Context Protocol (MCP) servers with Agno agents.
     This allows agents to access tools, resources, and prompts exposed by MCP servers.
 
-    Can be used in three ways:
+    Can be used in four ways:
     1. Direct initialization with a ClientSession
     2. As an async context manager with StdioServerParameters
     3. As an async context manager with SSE or Streamable HTTP client parameters
+    4. As a sync context manager, running the session on a background event loop
     """
 
     def __init__(
@@ -63,6 +72,7 @@ class MCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        cache_tools: bool = False,
         **kwargs,
     ):
         """
@@ -79,6 +89,8 @@ class MCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all)
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
             transport: The transport protocol to use, either "stdio" or "sse" or "streamable-http"
+            cache_tools: Reuse the tools listed by an earlier session for the same stdio server, for up to
+                MCP_TOOLS_CACHE_TTL_SECONDS or until the server reports its tools changed
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -121,6 +133,7 @@ class MCPTools(Toolkit):
                     )
 
         self.timeout_seconds = timeout_seconds
+        self.cache_tools = cache_tools
         self.session: Optional[ClientSession] = session
         self.server_params: Optional[Union[StdioServerParameters, SSEClientParams, StreamableHTTPClientParams]] = (
             server_params
@@ -152,6 +165,51 @@ class MCPTools(Toolkit):
         self._session_context = None
         self._initialized = False
 
+        # Used when the toolkit is entered as a sync context manager
+        self._sync_session = False
+        self._sync_session_task: Optional[concurrent.futures.Future] = None
+        self._sync_session_closed: Optional[asyncio.Event] = None
+
+    def __enter__(self) -> "MCPTools":
+        """Enter the sync context manager, keeping the session open on the background event loop."""
+        if self.session is not None:
+            # A caller-supplied session is bound to the caller's event loop, not to the background one
+            raise ValueError(
+                "The sync context manager cannot be used with an existing session. Use 'async with' instead."
+            )
+        self._sync_session = True
+        session_ready: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            self._sync_session_task = get_blocking_portal().start_task_soon(self._hold_sync_session, session_ready)
+            session_ready.result()
+        except BaseException:
+            self._sync_session_task = None
+            self._sync_session_closed = None
+            self._sync_session = False
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the sync context manager, closing the session on the background event loop."""
+        if self._sync_session_task is not None and self._sync_session_closed is not None:
+            get_blocking_portal().call(self._sync_session_closed.set)
+            self._sync_session_task.result()
+        self._sync_session_task = None
+        self._sync_session_closed = None
+        self._sync_session = False
+
+    async def _hold_sync_session(self, session_ready: concurrent.futures.Future) -> None:
+        """Enter and exit the async context in a single task, as required by the MCP client transports."""
+        self._sync_session_closed = asyncio.Event()
+        try:
+            async with self:
+                session_ready.set_result(None)
+                await self._sync_session_closed.wait()
+        except BaseException as e:
+            if not session_ready.done():
+                session_ready.set_exception(e)
+            raise
+
     async def __aenter__(self) -> "MCPTools":
         """Enter the async context manager."""
 
@@ -186,7 +244,15 @@ class MCPTools(Toolkit):
         session_params = await self._context.__aenter__()  # type: ignore
         read, write = session_params[0:2]
 
-        self._session_context = ClientSession(read, write, read_timeout_seconds=timedelta(seconds=client_timeout))  # type: ignore
+        # Drop the cached tools of the server when it reports its tools changed
+        message_handler = (
+            get_tools_cache_message_handler(self.server_params)
+            if self.cache_tools and isinstance(self.server_params, StdioServerParameters)
+            else None
+        )
+        self._session_context = ClientSession(  # type: ignore
+            read, write, read_timeout_seconds=timedelta(seconds=client_timeout), message_handler=message_handler
+        )
         self.session = await self._session_context.__aenter__()  # type: ignore
 
         # Initialize with the new session
@@ -218,18 +284,23 @@ class MCPTools(Toolkit):
             # Initialize the session if not already initialized
             await self.session.initialize()
 
-            # Get the list of tools from the MCP server
-            available_tools = await self.session.list_tools()
+            # Get the list of tools from the MCP server, cached by the parameters of stdio servers if enabled
+            cached_params = (
+                self.server_params
+                if self.cache_tools and isinstance(self.server_params, StdioServerParameters)
+                else None
+            )
+            available_tools = await list_tools(self.session, cached_params)
 
             self._check_tools_filters(
-                available_tools=[tool.name for tool in available_tools.tools],
+                available_tools=[tool.name for tool in available_tools],
                 include_tools=self.include_tools,
                 exclude_tools=self.exclude_tools,
             )
 
             # Filter tools based on include/exclude lists
             filtered_tools = []
-            for tool in available_tools.tools:
+            for tool in available_tools:
                 if self.exclude_tools and tool.name in self.exclude_tools:
                     continue
                 if self.include_tools is None or tool.name in self.include_tools:
@@ -239,7 +310,10 @@ class MCPTools(Toolkit):
             for tool in filtered_tools:
                 try:
                     # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, self.session)
+                    if self._sync_session:
+                        entrypoint = get_sync_entrypoint_for_tool(tool, self.session, self.timeout_seconds)
+                    else:
+                        entrypoint = get_entrypoint_for_tool(tool, self.session)
                     # Create a Function for the tool
                     f = Function(
                         name=tool.name,
@@ -288,6 +362,7 @@ class MultiMCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        cache_tools: bool = False,
         **kwargs,
     ):
         """
@@ -303,6 +378,8 @@ class MultiMCPTools(Toolkit):
             timeout_seconds: Timeout in seconds for managing timeouts for Client Session if Agent or Tool doesn't respond.
             include_tools: Optional list of tool names to include (if None, includes all).
             exclude_tools: Optional list of tool names to exclude (if None, excludes none).
+            cache_tools: Reuse the tools listed by an earlier session for the same stdio server, for up to
+                MCP_TOOLS_CACHE_TTL_SECONDS or until the server reports its tools changed.
         """
         super().__init__(name="MultiMCPTools", **kwargs)
 
@@ -331,6 +408,7 @@ class MultiMCPTools(Toolkit):
             server_params_list or []
         )
         self.timeout_seconds = timeout_seconds
+        self.cache_tools = cache_tools
         self.commands: Optional[List[str]] = commands
         self.urls: Optional[List[str]] = urls
         # Merge provided env with system env
@@ -376,10 +454,17 @@ class MultiMCPTools(Toolkit):
             if isinstance(server_params, StdioServerParameters):
                 stdio_transport = await self._async_exit_stack.enter_async_context(stdio_client(server_params))
                 read, write = stdio_transport
+                # Drop the cached tools of the server when it reports its tools changed
+                message_handler = get_tools_cache_message_handler(server_params) if self.cache_tools else None
                 session = await self._async_exit_stack.enter_async_context(
-                    ClientSession(read, write, read_timeout_seconds=timedelta(seconds=self.timeout_seconds))
+                    ClientSession(
+                        read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=self.timeout_seconds),
+                        message_handler=message_handler,
+                    )
                 )
-                await self.initialize(session)
+                await self.initialize(session, server_params)
             # Handle SSE connections
             elif isinstance(server_params, SSEClientParams):
                 client_connection = await self._async_exit_stack.enter_async_context(
@@ -409,19 +494,19 @@ class MultiMCPTools(Toolkit):
         """Exit the async context manager."""
         await self._async_exit_stack.aclose()
 
-    async def initialize(self, session: ClientSession) -> None:
+    async def initialize(self, session: ClientSession, server_params: Optional[StdioServerParameters] = None) -> None:
         """Initialize the MCP toolkit by getting available tools from the MCP server"""
 
         try:
             # Initialize the session if not already initialized
             await session.initialize()
 
-            # Get the list of tools from the MCP server
-            available_tools = await session.list_tools()
+            # Get the list of tools from the MCP server, cached by the parameters of stdio servers if enabled
+            available_tools = await list_tools(session, server_params if self.cache_tools else None)
 
             # Filter tools based on include/exclude lists
             filtered_tools = []
-            for tool in available_tools.tools:
+            for tool in available_tools:
                 if self.exclude_tools and tool.name in self.exclude_tools:
                     continue
                 if self.include_tools is None or tool.name in self.include_tools:
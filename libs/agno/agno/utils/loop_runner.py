@@ -0,0 +1,65 @@
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+import anyio
+from anyio.from_thread import BlockingPortal
+
+T = TypeVar("T")
+
+# Portal used to run async code from sync code. Its event loop is started lazily on a daemon thread and reused for
+# every call, the same way the MCP SDK bridges sync and async code with anyio.
+_portal: Optional[BlockingPortal] = None
+_portal_lock = threading.Lock()
+
+
+def _stop_blocking_portal(portal: BlockingPortal) -> None:
+    try:
+        portal.call(portal.stop, True)
+    except RuntimeError:
+        # The portal is not running anymore
+        pass
+
+
+def get_blocking_portal() -> BlockingPortal:
+    """Return the shared blocking portal, starting its event loop on first use."""
+    global _portal
+
+    if _portal is None:
+        with _portal_lock:
+            if _portal is None:
+                portal_ready: concurrent.futures.Future = concurrent.futures.Future()
+
+                async def run_portal() -> None:
+                    async with BlockingPortal() as portal:
+                        portal_ready.set_result(portal)
+                        await portal.sleep_until_stopped()
+
+                threading.Thread(target=anyio.run, args=(run_portal,), name="agno-loop-runner", daemon=True).start()
+                _portal = portal_ready.result()
+                atexit.register(_stop_blocking_portal, _portal)
+    return _portal
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: The coroutine to run
+        timeout: Seconds to wait for the result. The coroutine is cancelled if it takes longer.
+
+    Returns:
+        The result of the coroutine
+
+    Raises:
+        TimeoutError: If the coroutine did not complete within the timeout
+    """
+    future = get_blocking_portal().start_task_soon(lambda: coro)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        # Cancelling the future cancels the task running on the portal
+        future.cancel()
+        raise TimeoutError(f"Timed out after {timeout} seconds")
@@ -1,11 +1,27 @@
+import itertools
+import os
+import time
+from datetime import timedelta
 from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
+from weakref import WeakValueDictionary
 
 from agno.utils.log import log_debug, log_exception
+from agno.utils.loop_runner import run_sync
 
 try:
-    from mcp import ClientSession
-    from mcp.types import CallToolResult, EmbeddedResource, ImageContent, TextContent
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.session import MessageHandlerFnT
+    from mcp.types import (
+        CallToolResult,
+        EmbeddedResource,
+        ImageContent,
+        ServerNotification,
+        TextContent,
+        TextResourceContents,
+        ToolListChangedNotification,
+    )
     from mcp.types import Tool as MCPTool
 except (ImportError, ModuleNotFoundError):
     raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
@@ -13,54 +29,243 @@ except (ImportError, ModuleNotFoundError):
 
 from agno.media import ImageArtifact
 
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
+# Entrypoints keyed by (session id, tool name, timeout), reused when the tools of a session are registered again.
+# An entry lives only as long as its entrypoint, which keeps the session alive, so a session id is never reused
+# while its entries exist.
+_ENTRYPOINT_CACHE: "WeakValueDictionary[Tuple[int, str, Optional[int]], Callable]" = WeakValueDictionary()
+_SYNC_ENTRYPOINT_CACHE: "WeakValueDictionary[Tuple[int, str, Optional[int]], Callable]" = WeakValueDictionary()
+
+# Embedded resources larger than this are summarized instead of being serialized into the response
+_MAX_EMBEDDED_RESOURCE_SIZE = 1_000_000
+
+# Image artifact ids are persisted with the run, so they must not repeat across processes or restarts. Each process
+# draws a random token once and numbers its images with a counter, instead of drawing a random UUID per image.
+_IMG_COUNTER = itertools.count(1)
+_IMG_ID_TOKEN = uuid4().hex
+
+
+def _reset_image_ids() -> None:
+    global _IMG_COUNTER, _IMG_ID_TOKEN
+    _IMG_COUNTER = itertools.count(1)
+    _IMG_ID_TOKEN = uuid4().hex
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_image_ids)
+
+
+def _handle_text_content(content_item: TextContent, agent: "Agent") -> str:
+    return content_item.text
+
+
+def _build_image_artifact(content_item: ImageContent) -> ImageArtifact:
+    return ImageArtifact(
+        id=f"mcp-img-{_IMG_ID_TOKEN}-{next(_IMG_COUNTER)}",
+        # `url` is not part of the ImageContent schema, but servers can send it as an extra field
+        url=getattr(content_item, "url", None),
+        content=content_item.data,
+        mime_type=content_item.mimeType or "image/png",
+    )
+
+
+def _handle_image_content(content_item: ImageContent, agent: "Agent") -> str:
+    agent.add_image(_build_image_artifact(content_item))
+    return "Image has been generated and added to the response."
+
+
+def _handle_embedded_resource(content_item: EmbeddedResource, agent: "Agent") -> str:
+    resource = content_item.resource
+    # Check the size on the resource itself, without serializing it
+    size = len(resource.text) if isinstance(resource, TextResourceContents) else len(resource.blob)
+    if size > _MAX_EMBEDDED_RESOURCE_SIZE:
+        return f"[Embedded resource {resource.uri} omitted: {size} characters]"
+    return f"[Embedded resource: {resource.model_dump_json()}]"
+
+
+# Content handlers keyed by the exact content type, so each content item needs a single lookup
+_CONTENT_HANDLERS: Dict[type, Callable[[Any, Any], str]] = {
+    TextContent: _handle_text_content,
+    ImageContent: _handle_image_content,
+    EmbeddedResource: _handle_embedded_resource,
+}
+
+
+async def _async_call_tool(
+    session: ClientSession,
+    tool_name: str,
+    kwargs: Dict[str, Any],
+    agent: "Agent",
+    read_timeout: Optional[timedelta] = None,
+) -> str:
+    """Call an MCP tool and convert its result into a string response."""
+    try:
+        log_debug(f"Calling MCP Tool '{tool_name}' with args: {kwargs}")
+        result: CallToolResult = await session.call_tool(tool_name, kwargs, read_timeout_seconds=read_timeout)  # type: ignore
 
-def get_entrypoint_for_tool(tool: MCPTool, session: ClientSession):
+        # Return an error if the tool call failed
+        if result.isError:
+            raise Exception(f"Error from MCP tool '{tool_name}': {result.content}")
+
+        # Most tools return a single text item, which needs no assembly
+        if len(result.content) == 1 and isinstance(result.content[0], TextContent):
+            return result.content[0].text.strip()
+
+        # Process the result content
+        parts: List[str] = []
+        for content_item in result.content:
+            handler = _CONTENT_HANDLERS.get(type(content_item))
+            if handler is not None:
+                parts.append(handler(content_item, agent))
+            else:
+                # Handle other content types
+                parts.append(f"[Unsupported content type: {content_item.type}]")
+
+        return "\n".join(parts).strip()
+    except Exception as e:
+        log_exception(f"Failed to call MCP tool '{tool_name}': {e}")
+        return f"Error: {e}"
+
+
+# Seconds the listed tools of a stdio server are reused for, before the server is asked again
+MCP_TOOLS_CACHE_TTL_SECONDS = 300
+
+# list_tools() results of stdio servers and the time they were listed at, keyed by the server parameters
+_MCP_TOOLS_CACHE: Dict[Tuple[Any, ...], Tuple[float, List[MCPTool]]] = {}
+_MCP_TOOLS_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def _get_tools_cache_key(server_params: StdioServerParameters) -> Tuple[Any, ...]:
+    return (
+        server_params.command,
+        tuple(server_params.args),
+        frozenset(server_params.env.items()) if server_params.env is not None else None,
+        str(server_params.cwd) if server_params.cwd is not None else None,
+    )
+
+
+async def list_tools(
+    session: ClientSession,
+    server_params: Optional[StdioServerParameters] = None,
+    ttl_seconds: float = MCP_TOOLS_CACHE_TTL_SECONDS,
+) -> List[MCPTool]:
+    """
+    Return the tools exposed by an MCP server.
+
+    If server_params are given, the tools are cached by them for ttl_seconds, so sessions started again for the same
+    stdio server reuse the tools listed by the first session. Use clear_tools_cache() to drop the cached tools earlier.
+
+    Args:
+        session: The session to list the tools with
+        server_params: The parameters of the stdio server to cache the tools for, if any
+        ttl_seconds: Seconds the cached tools are reused for
+
+    Returns:
+        List[MCPTool]: The tools exposed by the server
+    """
+    if server_params is None:
+        return (await session.list_tools()).tools
+
+    cache_key = _get_tools_cache_key(server_params)
+    cached = _MCP_TOOLS_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+        _MCP_TOOLS_CACHE_STATS["hits"] += 1
+        return cached[1]
+
+    _MCP_TOOLS_CACHE_STATS["misses"] += 1
+    tools = (await session.list_tools()).tools
+    _MCP_TOOLS_CACHE[cache_key] = (time.monotonic(), tools)
+    return tools
+
+
+def clear_tools_cache(server_params: Optional[StdioServerParameters] = None) -> None:
+    """
+    Drop the cached tools of a stdio server, or of all servers if no server parameters are given.
+
+    Args:
+        server_params: The parameters of the stdio server to drop the cached tools of
+    """
+    if server_params is None:
+        _MCP_TOOLS_CACHE.clear()
+    else:
+        _MCP_TOOLS_CACHE.pop(_get_tools_cache_key(server_params), None)
+
+
+def get_tools_cache_message_handler(server_params: StdioServerParameters) -> MessageHandlerFnT:
+    """
+    Return a ClientSession message handler dropping the cached tools of a stdio server when its tools change.
+
+    Args:
+        server_params: The parameters of the stdio server the session is connected to
+
+    Returns:
+        Callable: The message handler to pass to the ClientSession
+    """
+
+    async def message_handler(message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            log_debug(f"Tools of MCP server '{server_params.command}' changed, dropping its cached tools")
+            clear_tools_cache(server_params)
+
+    return message_handler
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Return the hits, misses and size of the MCP tools cache."""
+    return {**_MCP_TOOLS_CACHE_STATS, "size": len(_MCP_TOOLS_CACHE)}
+
+
+def get_entrypoint_for_tool(tool: MCPTool, session: ClientSession, timeout_seconds: Optional[int] = None):
     """
     Return an entrypoint for an MCP tool.
 
     Args:
         tool: The MCP tool to create an entrypoint for
         session: The session to use
+        timeout_seconds: Read timeout in seconds for the tool call. Defaults to the session read timeout.
 
     Returns:
         Callable: The entrypoint function for the tool
     """
-    from agno.agent import Agent
+    cache_key = (id(session), tool.name, timeout_seconds)
+    entrypoint = _ENTRYPOINT_CACHE.get(cache_key)
+    if entrypoint is not None:
+        return entrypoint
+
+    read_timeout = timedelta(seconds=timeout_seconds) if timeout_seconds is not None else None
+
+    async def call_tool(agent: "Agent", tool_name: str, **kwargs) -> str:
+        return await _async_call_tool(session, tool_name, kwargs, agent, read_timeout)
+
+    entrypoint = _ENTRYPOINT_CACHE[cache_key] = partial(call_tool, tool_name=tool.name)
+    return entrypoint
+
+
+def get_sync_entrypoint_for_tool(tool: MCPTool, session: ClientSession, timeout_seconds: int = 5):
+    """
+    Return a sync entrypoint for an MCP tool.
+
+    The tool call runs on the shared loop of agno.utils.loop_runner, so the session must be running on that loop.
+
+    Args:
+        tool: The MCP tool to create an entrypoint for
+        session: The session to use
+        timeout_seconds: Seconds to wait for the tool call to complete
+
+    Returns:
+        Callable: The entrypoint function for the tool
+    """
+    cache_key = (id(session), tool.name, timeout_seconds)
+    entrypoint = _SYNC_ENTRYPOINT_CACHE.get(cache_key)
+    if entrypoint is not None:
+        return entrypoint
+
+    read_timeout = timedelta(seconds=timeout_seconds)
+
+    def call_tool_sync(agent: "Agent", tool_name: str, **kwargs) -> str:
+        return run_sync(_async_call_tool(session, tool_name, kwargs, agent, read_timeout), timeout_seconds)
 
-    async def call_tool(agent: Agent, tool_name: str, **kwargs) -> str:
-        try:
-            log_debug(f"Calling MCP Tool '{tool_name}' with args: {kwargs}")
-            result: CallToolResult = await session.call_tool(tool_name, kwargs)  # type: ignore
-
-            # Return an error if the tool call failed
-            if result.isError:
-                raise Exception(f"Error from MCP tool '{tool_name}': {result.content}")
-
-            # Process the result content
-            response_str = ""
-            for content_item in result.content:
-                if isinstance(content_item, TextContent):
-                    response_str += content_item.text + "\n"
-                elif isinstance(content_item, ImageContent):
-                    # Handle image content if present
-                    img_artifact = ImageArtifact(
-                        id=str(uuid4()),
-                        url=getattr(content_item, "url", None),
-                        content=getattr(content_item, "data", None),
-                        mime_type=getattr(content_item, "mimeType", "image/png"),
-                    )
-                    agent.add_image(img_artifact)
-                    response_str += "Image has been generated and added to the response.\n"
-                elif isinstance(content_item, EmbeddedResource):
-                    # Handle embedded resources
-                    response_str += f"[Embedded resource: {content_item.resource.model_dump_json()}]\n"
-                else:
-                    # Handle other content types
-                    response_str += f"[Unsupported content type: {content_item.type}]\n"
-
-            return response_str.strip()
-        except Exception as e:
-            log_exception(f"Failed to call MCP tool '{tool_name}': {e}")
-            return f"Error: {e}"
-
-    return partial(call_tool, tool_name=tool.name)
+    entrypoint = _SYNC_ENTRYPOINT_CACHE[cache_key] = partial(call_tool_sync, tool_name=tool.name)
+    return entrypoint
@@ -1,9 +1,14 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 from ag_ui.core import EventType
 
-from agno.app.agui.utils import EventBuffer, async_stream_agno_response_as_agui_events
+from agno.app.agui.utils import (
+    EventBuffer,
+    _emit_event_logic,
+    async_stream_agno_response_as_agui_events,
+    stream_agno_response_as_agui_events,
+)
 from agno.run.response import RunResponseContentEvent, ToolCallCompletedEvent, ToolCallStartedEvent
 
 
@@ -153,6 +158,55 @@ def test_event_buffer_blocking_behavior_edge_cases():
     assert not buffer.is_blocked()
 
 
+def test_event_buffer_coalesces_buffered_tool_call_args():
+    """Test that args deltas buffered for the same tool call are flushed as a single event"""
+    from ag_ui.core import ToolCallArgsEvent, ToolCallEndEvent, ToolCallStartEvent
+
+    buffer = EventBuffer()
+    _emit_event_logic(
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="tool_1", tool_call_name="a"), buffer
+    )
+    _emit_event_logic(
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="tool_2", tool_call_name="b"), buffer
+    )
+    for delta in ['{"query": ', '"test"', "}"]:
+        _emit_event_logic(ToolCallArgsEvent(type=EventType.TOOL_CALL_ARGS, tool_call_id="tool_2", delta=delta), buffer)
+    assert len(buffer.buffer) == 2
+
+    events = _emit_event_logic(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="tool_1"), buffer)
+
+    assert [event.type for event in events] == [
+        EventType.TOOL_CALL_END,
+        EventType.TOOL_CALL_START,
+        EventType.TOOL_CALL_ARGS,
+    ]
+    assert events[2].delta == '{"query": "test"}'
+    assert len(buffer.buffer) == 0
+
+
+def test_event_buffer_flush_blocked_by_buffered_tool_call():
+    """Test that events blocked again by a buffered tool call stay buffered until that tool call ends"""
+    from ag_ui.core import TextMessageContentEvent, ToolCallEndEvent, ToolCallStartEvent
+
+    buffer = EventBuffer()
+    _emit_event_logic(
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="tool_1", tool_call_name="a"), buffer
+    )
+    _emit_event_logic(
+        ToolCallStartEvent(type=EventType.TOOL_CALL_START, tool_call_id="tool_2", tool_call_name="b"), buffer
+    )
+    _emit_event_logic(TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id="1", delta="Hi"), buffer)
+
+    events = _emit_event_logic(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="tool_1"), buffer)
+    assert [event.type for event in events] == [EventType.TOOL_CALL_END, EventType.TOOL_CALL_START]
+    assert buffer.blocking_tool_call_id == "tool_2"
+    assert len(buffer.buffer) == 1
+
+    events = _emit_event_logic(ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="tool_2"), buffer)
+    assert [event.type for event in events] == [EventType.TOOL_CALL_END, EventType.TEXT_MESSAGE_CONTENT]
+    assert len(buffer.buffer) == 0
+
+
 @pytest.mark.asyncio
 async def test_stream_basic():
     """Test the async_stream_agno_response_as_agui_events function emits all expected events in a basic case."""
@@ -196,10 +250,9 @@ async def test_stream_with_tool_call_blocking():
         tool_start_response = ToolCallStartedEvent()
         tool_start_response.event = RunEvent.tool_call_started
         tool_start_response.content = ""
-        tool_call = MagicMock()
-        tool_call.tool_call_id = "tool_1"
-        tool_call.tool_name = "search"
-        tool_call.tool_args = {"query": "test"}
+        tool_call = SimpleNamespace(
+            tool_call_id="tool_1", tool_name="search", tool_args={"query": "test"}, result="Results"
+        )
         tool_start_response.tool = tool_call
         yield tool_start_response
 
@@ -235,3 +288,179 @@ async def test_stream_with_tool_call_blocking():
     tool_start_idx = event_types.index(EventType.TOOL_CALL_START)
     tool_end_idx = event_types.index(EventType.TOOL_CALL_END)
     assert tool_start_idx < tool_end_idx
+
+
+def _unfinished_tool_calls_chunks():
+    from agno.run.response import RunEvent
+
+    chunks = []
+    for tool_call_id in ("tool_1", "tool_2"):
+        tool_start_response = ToolCallStartedEvent()
+        tool_start_response.event = RunEvent.tool_call_started
+        tool_start_response.content = ""
+        tool_start_response.tool = SimpleNamespace(
+            tool_call_id=tool_call_id, tool_name="search", tool_args={"query": "test"}, result=None
+        )
+        chunks.append(tool_start_response)
+    text_response = RunResponseContentEvent()
+    text_response.event = RunEvent.run_response_content
+    text_response.content = "hi"
+    chunks.append(text_response)
+    completed_response = RunResponseContentEvent()
+    completed_response.event = RunEvent.run_completed
+    completed_response.content = ""
+    chunks.append(completed_response)
+    return chunks
+
+
+def _assert_run_finished_after_unfinished_tool_calls(events):
+    event_types = [event.type for event in events]
+    assert event_types[-1] == EventType.RUN_FINISHED
+    assert event_types.count(EventType.RUN_FINISHED) == 1
+    assert EventType.TEXT_MESSAGE_START in event_types
+    assert EventType.TEXT_MESSAGE_END in event_types
+    assert "".join(event.delta for event in events if event.type == EventType.TEXT_MESSAGE_CONTENT) == "hi"
+    ended_tool_call_ids = [event.tool_call_id for event in events if event.type == EventType.TOOL_CALL_END]
+    assert sorted(ended_tool_call_ids) == ["tool_1", "tool_2"]
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_unfinished_tool_calls_on_run_completion():
+    """Test that tool calls still running at run completion are ended and every buffered event is emitted"""
+
+    async def mock_stream():
+        for chunk in _unfinished_tool_calls_chunks():
+            yield chunk
+
+    events = []
+    async for event in async_stream_agno_response_as_agui_events(mock_stream(), "thread_1", "run_1"):
+        events.append(event)
+
+    _assert_run_finished_after_unfinished_tool_calls(events)
+
+
+def test_sync_stream_ends_unfinished_tool_calls_on_run_completion():
+    """Test that the sync stream ends tool calls still running at run completion and emits every buffered event"""
+    events = list(stream_agno_response_as_agui_events(iter(_unfinished_tool_calls_chunks()), "thread_1", "run_1"))
+
+    _assert_run_finished_after_unfinished_tool_calls(events)
+
+
+@pytest.mark.asyncio
+async def test_stream_coalesces_adjacent_text_deltas():
+    """Test that text deltas streamed within the flush interval are emitted as a single content event"""
+    import asyncio
+
+    from agno.run.response import RunEvent
+
+    async def mock_stream():
+        for content in ["Hello", " ", "world"]:
+            text_response = RunResponseContentEvent()
+            text_response.event = RunEvent.run_response_content
+            text_response.content = content
+            yield text_response
+        # Text streamed after the flush interval goes in a new content event
+        await asyncio.sleep(0.1)
+        text_response = RunResponseContentEvent()
+        text_response.event = RunEvent.run_response_content
+        text_response.content = "!"
+        yield text_response
+        completed_response = RunResponseContentEvent()
+        completed_response.event = RunEvent.run_completed
+        completed_response.content = ""
+        yield completed_response
+
+    events = []
+    async for event in async_stream_agno_response_as_agui_events(
+        mock_stream(), "thread_1", "run_1", flush_interval=0.02
+    ):
+        events.append(event)
+
+    assert [event.type for event in events] == [
+        EventType.TEXT_MESSAGE_START,
+        EventType.TEXT_MESSAGE_CONTENT,
+        EventType.TEXT_MESSAGE_CONTENT,
+        EventType.TEXT_MESSAGE_END,
+        EventType.RUN_FINISHED,
+    ]
+    assert events[1].delta == "Hello world"
+    assert events[2].delta == "!"
+
+
+@pytest.mark.asyncio
+async def test_stream_processes_queued_chunks_in_batches():
+    """Test that a burst of chunks larger than a batch is mapped in order"""
+    from agno.app.agui.utils import MAX_CHUNK_BATCH_SIZE
+    from agno.run.response import RunEvent
+
+    async def mock_stream():
+        for i in range(MAX_CHUNK_BATCH_SIZE * 3):
+            text_response = RunResponseContentEvent()
+            text_response.event = RunEvent.run_response_content
+            text_response.content = f"{i} "
+            yield text_response
+        completed_response = RunResponseContentEvent()
+        completed_response.event = RunEvent.run_completed
+        completed_response.content = ""
+        yield completed_response
+
+    events = []
+    async for event in async_stream_agno_response_as_agui_events(mock_stream(), "thread_1", "run_1", flush_interval=60):
+        events.append(event)
+
+    assert [event.type for event in events] == [
+        EventType.TEXT_MESSAGE_START,
+        EventType.TEXT_MESSAGE_CONTENT,
+        EventType.TEXT_MESSAGE_END,
+        EventType.RUN_FINISHED,
+    ]
+    assert events[1].delta == "".join(f"{i} " for i in range(MAX_CHUNK_BATCH_SIZE * 3))
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_coalesced_text_before_error():
+    """Test that text pending in the flush window is emitted before an error raised by the response stream"""
+    from agno.run.response import RunEvent
+
+    async def mock_stream():
+        text_response = RunResponseContentEvent()
+        text_response.event = RunEvent.run_response_content
+        text_response.content = "Hello"
+        yield text_response
+        raise ValueError("Stream failed")
+
+    events = []
+    with pytest.raises(ValueError, match="Stream failed"):
+        async for event in async_stream_agno_response_as_agui_events(
+            mock_stream(), "thread_1", "run_1", flush_interval=60
+        ):
+            events.append(event)
+
+    assert [event.type for event in events] == [EventType.TEXT_MESSAGE_START, EventType.TEXT_MESSAGE_CONTENT]
+    assert events[1].delta == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_stream_propagates_cancellation_raised_by_response_stream():
+    """Test that a CancelledError raised by the response stream reaches the caller instead of hanging the stream"""
+    import asyncio
+
+    from agno.run.response import RunEvent
+
+    async def mock_stream():
+        text_response = RunResponseContentEvent()
+        text_response.event = RunEvent.run_response_content
+        text_response.content = "Hello"
+        yield text_response
+        raise asyncio.CancelledError()
+
+    events = []
+
+    async def consume():
+        async for event in async_stream_agno_response_as_agui_events(mock_stream(), "thread_1", "run_1"):
+            events.append(event)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(consume(), 3)
+
+    assert [event.type for event in events] == [EventType.TEXT_MESSAGE_START, EventType.TEXT_MESSAGE_CONTENT]
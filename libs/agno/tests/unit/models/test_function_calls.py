@@ -0,0 +1,116 @@
+import asyncio
+import sys
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.tools.function import Function, FunctionCall
+
+
+class ConcurrencyTracker:
+    """Tracks how many tool calls are in flight at the same time."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def tool(self, index: int) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        # Yield to the event loop so that concurrent calls can start before this one ends
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return f"result-{index}"
+
+
+def _function_calls(tracker: ConcurrencyTracker, count: int):
+    function = Function(name="tracked_tool", entrypoint=tracker.tool, skip_entrypoint_processing=True)
+    return [
+        FunctionCall(function=function, arguments={"index": index}, call_id=f"call_{index}") for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_arun_function_calls_runs_calls_concurrently():
+    """Test that the async function calls of a turn are all in flight at the same time"""
+    tracker = ConcurrencyTracker()
+    function_call_results: list[Message] = []
+
+    model = OpenAIChat(id="gpt-4o")
+    async for _ in model.arun_function_calls(_function_calls(tracker, 3), function_call_results):
+        pass
+
+    assert tracker.peak == 3
+    assert tracker.in_flight == 0
+    assert [result.content for result in function_call_results] == ["result-0", "result-1", "result-2"]
+
+
+@pytest.mark.asyncio
+async def test_arun_function_calls_limits_concurrent_calls():
+    """Test that max_parallel_tools caps the number of function calls in flight"""
+    tracker = ConcurrencyTracker()
+    function_call_results: list[Message] = []
+
+    model = OpenAIChat(id="gpt-4o")
+    async for _ in model.arun_function_calls(_function_calls(tracker, 5), function_call_results, max_parallel_tools=2):
+        pass
+
+    assert tracker.peak == 2
+    assert [result.content for result in function_call_results] == [f"result-{index}" for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_arun_function_calls_runs_calls_serially_with_max_parallel_tools_of_one():
+    """Test that max_parallel_tools=1 runs the function calls one at a time, in order"""
+    tracker = ConcurrencyTracker()
+    function_call_results: list[Message] = []
+
+    model = OpenAIChat(id="gpt-4o")
+    async for _ in model.arun_function_calls(_function_calls(tracker, 3), function_call_results, max_parallel_tools=1):
+        pass
+
+    assert tracker.peak == 1
+    assert tracker.in_flight == 0
+    assert [result.content for result in function_call_results] == ["result-0", "result-1", "result-2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.TaskGroup requires Python 3.11+")
+async def test_arun_function_calls_raises_first_error_and_cancels_other_calls():
+    """Test that an error escaping a function call is re-raised as is and stops the other calls"""
+    tracker = ConcurrencyTracker()
+    function_calls = _function_calls(tracker, 2)
+    other_call_cancelled = asyncio.Event()
+
+    async def arun_function_call(function_call: FunctionCall):
+        if function_call.call_id == "call_0":
+            await asyncio.sleep(0)
+            raise RuntimeError("tool failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            other_call_cancelled.set()
+            raise
+
+    model = OpenAIChat(id="gpt-4o")
+    model.arun_function_call = arun_function_call  # type: ignore
+
+    with pytest.raises(RuntimeError, match="tool failed"):
+        async for _ in model.arun_function_calls(function_calls, []):
+            pass
+
+    assert other_call_cancelled.is_set()
+
+
+@pytest.mark.parametrize("max_parallel_tools", [None, 0])
+def test_agent_unlimited_max_parallel_tools_survives_deep_copy(max_parallel_tools):
+    """Test that an agent without a cap on concurrent tool calls keeps it after deep_copy"""
+    from agno.agent import Agent
+
+    agent = Agent(max_parallel_tools=max_parallel_tools)
+
+    assert agent.max_parallel_tools == 0
+    assert agent.deep_copy().max_parallel_tools == 0
+    assert Agent(max_parallel_tools=3).deep_copy().max_parallel_tools == 3
@@ -1,10 +1,21 @@
-from unittest.mock import AsyncMock, patch
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from agno.tools.mcp import MCPTools, MultiMCPTools
 
 
+@pytest.fixture(autouse=True)
+def clear_mcp_tools_cache():
+    """Keep cached MCP tools from leaking between tests"""
+    from agno.utils.mcp import clear_tools_cache
+
+    clear_tools_cache()
+    yield
+    clear_tools_cache()
+
+
 @pytest.mark.asyncio
 async def test_sse_transport_without_url_nor_sse_client_params():
     """Test that ValueError is raised when transport is SSE but URL is not provided."""
@@ -75,3 +86,241 @@ async def test_mcp_include_exclude_tools_bad_values(mcp_tools, kwargs):
     with pytest.raises(ValueError, match="not present in the toolkit"):
         tools.session = session_mock
         await tools.initialize()
+
+
+def test_mcp_sync_context_manager_uses_sync_entrypoints():
+    """Test that tools registered through the sync context manager can be called from sync code"""
+    from mcp.types import CallToolResult, ListToolsResult, TextContent
+    from mcp.types import Tool as MCPTool
+
+    session_mock = AsyncMock()
+    session_mock.list_tools.return_value = ListToolsResult(
+        tools=[MCPTool(name="echo", description="Echo the input", inputSchema={"type": "object"})]
+    )
+    session_mock.call_tool.return_value = CallToolResult(content=[TextContent(type="text", text=" hello\n")])
+
+    with patch("agno.tools.mcp.stdio_client") as stdio_client_mock:
+        with patch("agno.tools.mcp.ClientSession") as client_session_mock:
+            stdio_client_mock.return_value.__aenter__.return_value = (MagicMock(), MagicMock())
+            client_session_mock.return_value.__aenter__.return_value = session_mock
+
+            with MCPTools(command="echo-server") as tools:
+                assert tools._initialized
+                result = tools.functions["echo"].entrypoint(agent=None, text="hello")
+
+            assert tools.session is None
+            client_session_mock.return_value.__aexit__.assert_awaited_once()
+            stdio_client_mock.return_value.__aexit__.assert_awaited_once()
+
+    assert result == "hello"
+    session_mock.call_tool.assert_awaited_once_with(
+        "echo", {"text": "hello"}, read_timeout_seconds=timedelta(seconds=5)
+    )
+
+
+def test_mcp_sync_context_manager_rejects_existing_session():
+    """Test that the sync context manager cannot be used with a caller-supplied session"""
+    with pytest.raises(ValueError, match="cannot be used with an existing session"):
+        with MCPTools(session=AsyncMock()):
+            pass
+
+
+def test_mcp_sync_context_manager_resets_state_when_start_fails():
+    """Test that a failure to start the session leaves the toolkit ready to be entered again"""
+    tools = MCPTools(command="agno-nonexistent-mcp-server")
+
+    with pytest.raises(FileNotFoundError):
+        with tools:
+            pass
+
+    assert tools._sync_session is False
+    assert tools._sync_session_task is None
+    assert tools._sync_session_closed is None
+
+
+@pytest.mark.asyncio
+async def test_mcp_entrypoint_formats_content_items():
+    """Test that each MCP content type is converted into the tool response"""
+    from mcp.types import (
+        AudioContent,
+        CallToolResult,
+        EmbeddedResource,
+        ImageContent,
+        TextContent,
+        TextResourceContents,
+    )
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import _IMG_ID_TOKEN, get_entrypoint_for_tool
+
+    session_mock = AsyncMock()
+    session_mock.call_tool.return_value = CallToolResult(
+        content=[
+            TextContent(type="text", text="first"),
+            ImageContent(type="image", data="aGVsbG8=", mimeType="image/png"),
+            EmbeddedResource(type="resource", resource=TextResourceContents(uri="file:///notes.txt", text="notes")),
+            AudioContent(type="audio", data="aGVsbG8=", mimeType="audio/wav"),
+        ]
+    )
+    agent_mock = MagicMock()
+
+    entrypoint = get_entrypoint_for_tool(MCPTool(name="foo", inputSchema={"type": "object"}), session_mock)
+    result = await entrypoint(agent=agent_mock)
+
+    lines = result.split("\n")
+    assert lines[0] == "first"
+    assert lines[1] == "Image has been generated and added to the response."
+    assert lines[2].startswith("[Embedded resource: ") and "file:///notes.txt" in lines[2]
+    assert lines[3] == "[Unsupported content type: audio]"
+    agent_mock.add_image.assert_called_once()
+    image_artifact = agent_mock.add_image.call_args.args[0]
+    # Ids carry a random per-process token, so they don't repeat after a restart
+    assert image_artifact.id.startswith(f"mcp-img-{_IMG_ID_TOKEN}-")
+    assert image_artifact.mime_type == "image/png"
+    assert image_artifact.url is None
+
+
+def test_mcp_entrypoint_is_reused_for_the_same_session_and_tool():
+    """Test that registering the same tool of a session again reuses its entrypoint"""
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import get_entrypoint_for_tool
+
+    session_mock = AsyncMock()
+    tool = MCPTool(name="foo", inputSchema={"type": "object"})
+
+    entrypoint = get_entrypoint_for_tool(tool, session_mock)
+
+    assert get_entrypoint_for_tool(tool, session_mock) is entrypoint
+    assert get_entrypoint_for_tool(tool, AsyncMock()) is not entrypoint
+    assert get_entrypoint_for_tool(tool, session_mock, timeout_seconds=10) is not entrypoint
+
+
+@pytest.mark.asyncio
+async def test_mcp_tools_of_stdio_servers_are_cached():
+    """Test that sessions started again for the same stdio server reuse the listed tools when caching is enabled"""
+    from mcp.types import ListToolsResult
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import clear_tools_cache, get_cache_stats
+
+    session_mock = AsyncMock()
+    session_mock.list_tools.return_value = ListToolsResult(tools=[MCPTool(name="foo", inputSchema={"type": "object"})])
+    stats_before = get_cache_stats()
+
+    for _ in range(2):
+        tools = MCPTools(command="cached-server --flag", session=session_mock, cache_tools=True)
+        await tools.initialize()
+        assert "foo" in tools.functions
+
+    stats_after = get_cache_stats()
+    session_mock.list_tools.assert_awaited_once()
+    assert stats_after["misses"] == stats_before["misses"] + 1
+    assert stats_after["hits"] == stats_before["hits"] + 1
+    assert stats_after["size"] == 1
+
+    # Clearing the cache lists the tools again
+    clear_tools_cache(tools.server_params)
+    await MCPTools(command="cached-server --flag", session=session_mock, cache_tools=True).initialize()
+    assert session_mock.list_tools.await_count == 2
+
+    # Tools are not cached unless enabled
+    await MCPTools(command="cached-server --flag", session=session_mock).initialize()
+    assert session_mock.list_tools.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_mcp_cached_tools_expire():
+    """Test that cached tools are listed again once they are older than the TTL"""
+    from mcp import StdioServerParameters
+    from mcp.types import ListToolsResult
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import list_tools
+
+    session_mock = AsyncMock()
+    session_mock.list_tools.return_value = ListToolsResult(tools=[MCPTool(name="foo", inputSchema={"type": "object"})])
+    server_params = StdioServerParameters(command="cached-server")
+
+    await list_tools(session_mock, server_params)
+    await list_tools(session_mock, server_params)
+    assert session_mock.list_tools.await_count == 1
+
+    await list_tools(session_mock, server_params, ttl_seconds=0)
+    assert session_mock.list_tools.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_mcp_tools_list_changed_clears_cached_tools():
+    """Test that a tools/list_changed notification drops the cached tools of the server"""
+    from mcp import StdioServerParameters
+    from mcp.types import ListToolsResult, ServerNotification, ToolListChangedNotification
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import get_cache_stats, get_tools_cache_message_handler, list_tools
+
+    session_mock = AsyncMock()
+    session_mock.list_tools.return_value = ListToolsResult(tools=[MCPTool(name="foo", inputSchema={"type": "object"})])
+    server_params = StdioServerParameters(command="cached-server")
+    await list_tools(session_mock, server_params)
+    assert get_cache_stats()["size"] == 1
+
+    message_handler = get_tools_cache_message_handler(server_params)
+    await message_handler(ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed")))
+
+    assert get_cache_stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_mcp_entrypoint_summarizes_large_embedded_resources():
+    """Test that embedded resources over the size limit are not serialized into the response"""
+    from mcp.types import BlobResourceContents, CallToolResult, EmbeddedResource
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils import mcp as mcp_utils
+
+    session_mock = AsyncMock()
+    session_mock.call_tool.return_value = CallToolResult(
+        content=[
+            EmbeddedResource(
+                type="resource",
+                resource=BlobResourceContents(uri="file:///image.bin", blob="a" * 20),
+            )
+        ]
+    )
+
+    entrypoint = mcp_utils.get_entrypoint_for_tool(MCPTool(name="foo", inputSchema={"type": "object"}), session_mock)
+    with patch.object(mcp_utils, "_MAX_EMBEDDED_RESOURCE_SIZE", 10):
+        result = await entrypoint(agent=None)
+
+    assert result == "[Embedded resource file:///image.bin omitted: 20 characters]"
+
+
+def test_mcp_sync_entrypoint_cancels_tool_call_on_timeout():
+    """Test that a timed out sync tool call is cancelled instead of left running"""
+    import asyncio
+    import threading
+
+    from mcp.types import Tool as MCPTool
+
+    from agno.utils.mcp import get_sync_entrypoint_for_tool
+
+    call_cancelled = threading.Event()
+
+    async def call_tool(name, arguments, read_timeout_seconds=None):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            call_cancelled.set()
+            raise
+
+    session_mock = AsyncMock()
+    session_mock.call_tool.side_effect = call_tool
+
+    entrypoint = get_sync_entrypoint_for_tool(
+        MCPTool(name="slow", inputSchema={"type": "object"}), session_mock, timeout_seconds=0.1
+    )
+    with pytest.raises(TimeoutError):
+        entrypoint(agent=None)
+
+    assert call_cancelled.wait(timeout=2)
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+import pytest
+
+from agno.utils.loop_runner import get_blocking_portal, run_sync
+
+
+def test_run_sync_returns_coroutine_result():
+    """Test that run_sync runs the coroutine on the shared loop and returns its result"""
+
+    async def add(a: int, b: int) -> int:
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_sync(add(1, 2)) == 3
+    assert run_sync(add(3, 4), timeout=5) == 7
+
+
+def test_run_sync_reuses_the_shared_portal():
+    """Test that every call goes through the same portal"""
+    portal = get_blocking_portal()
+
+    async def get_thread_name() -> str:
+        return threading.current_thread().name
+
+    assert run_sync(get_thread_name()) == run_sync(get_thread_name()) == "agno-loop-runner"
+    assert get_blocking_portal() is portal
+
+
+def test_run_sync_propagates_exceptions():
+    """Test that exceptions raised by the coroutine are raised by run_sync"""
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        run_sync(fail())
+
+
+def test_run_sync_cancels_coroutine_on_timeout():
+    """Test that a coroutine taking longer than the timeout is cancelled"""
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        run_sync(slow(), timeout=0.1)
+
+    assert cancelled.wait(timeout=2)